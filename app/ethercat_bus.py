@@ -7,42 +7,84 @@ FakeEtherCATBus to share commands/states in-memory.
 
 from __future__ import annotations
 
+import importlib
 import threading
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
-try:
-    import pysoem  # type: ignore
-except Exception:  # pragma: no cover - pysoem opsiyonel
-    pysoem = None
+
+def _freeze(payload: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Return a read-only snapshot of payload (no-op if already frozen)."""
+    if isinstance(payload, MappingProxyType):
+        return payload
+    return MappingProxyType(dict(payload))
+
+
+class _Shard:
+    """Mailboxes and writer lock for the slave_ids hashed to one shard."""
+
+    __slots__ = ("cmd", "state", "version", "wake_events", "lock")
+
+    def __init__(self) -> None:
+        self.cmd: Dict[str, Mapping[str, Any]] = {}
+        self.state: Dict[str, Mapping[str, Any]] = {}
+        self.version: Dict[str, int] = {}
+        self.wake_events: Dict[str, List[threading.Event]] = {}
+        self.lock = threading.Lock()
 
 
 class FakeEtherCATBus:
     """
-    In-memory, thread-safe master/slave mailbox.
+    In-memory master/slave mailbox.
     Master writes commands, client reads; client writes state, master reads.
+
+    Each slave_id slot has a single producer and a single consumer, so the
+    mailboxes are plain dicts: setitem/pop/get are atomic under the GIL and
+    need no lock. Commands and states are published as read-only
+    snapshots, so readers get the stored reference without a copy.
+    Each state publish bumps a per-slave version so readers can skip
+    unchanged states; only writers take a lock. Slaves are spread over
+    SHARDS independent shards so writers for different slaves rarely
+    share a lock.
     """
 
+    SHARDS = 16  # power of two; shard index is hash(slave_id) & (SHARDS - 1)
+
     def __init__(self) -> None:
-        self._command_mailbox: Dict[str, Dict[str, Any]] = {}
-        self._state_mailbox: Dict[str, Dict[str, Any]] = {}
-        self._lock = threading.Lock()
+        self._shards = [_Shard() for _ in range(self.SHARDS)]
+
+    def _shard(self, slave_id: str) -> _Shard:
+        return self._shards[hash(slave_id) & (self.SHARDS - 1)]
+
+    def register_wake_event(self, slave_id: str, event: threading.Event) -> None:
+        """Have write_master_command set event whenever slave_id gets a command."""
+        shard = self._shard(slave_id)
+        with shard.lock:
+            shard.wake_events[slave_id] = [*shard.wake_events.get(slave_id, ()), event]
+
+    def write_master_command(self, slave_id: str, command: Mapping[str, Any]) -> None:
+        shard = self._shard(slave_id)
+        shard.cmd[slave_id] = _freeze(command)
+        for event in shard.wake_events.get(slave_id, ()):
+            event.set()
 
-    def write_master_command(self, slave_id: str, command: Dict[str, Any]) -> None:
-        with self._lock:
-            self._command_mailbox[slave_id] = command
+    def pop_slave_command(self, slave_id: str) -> Optional[Mapping[str, Any]]:
+        return self._shard(slave_id).cmd.pop(slave_id, None)
 
-    def pop_slave_command(self, slave_id: str) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            return self._command_mailbox.pop(slave_id, None)
+    def write_slave_state(self, slave_id: str, state: Mapping[str, Any]) -> None:
+        snapshot = _freeze(state)
+        shard = self._shard(slave_id)
+        with shard.lock:
+            # Store before bumping: a reader seeing version N gets state >= N.
+            shard.state[slave_id] = snapshot
+            shard.version[slave_id] = shard.version.get(slave_id, 0) + 1
 
-    def write_slave_state(self, slave_id: str, state: Dict[str, Any]) -> None:
-        with self._lock:
-            self._state_mailbox[slave_id] = state
+    def read_slave_state(self, slave_id: str) -> Optional[Mapping[str, Any]]:
+        return self._shard(slave_id).state.get(slave_id) or None
 
-    def read_slave_state(self, slave_id: str) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            data = self._state_mailbox.get(slave_id)
-            return dict(data) if data else None
+    def state_version(self, slave_id: str) -> int:
+        """Publish counter for slave_id (0 = nothing published yet)."""
+        return self._shard(slave_id).version.get(slave_id, 0)
 
 
 # Demo default: shared bus within the same process
@@ -55,8 +97,11 @@ def create_bus(interface_name: str | None = None) -> FakeEtherCATBus:
     For demo, returns FakeEtherCATBus.
     """
     if interface_name:
-        if pysoem is None:
-            raise RuntimeError("pysoem is required for real EtherCAT but not installed.")
+        # Imported lazily: only the real-master path needs pysoem (optional).
+        try:
+            importlib.import_module("pysoem")
+        except ImportError as exc:
+            raise RuntimeError("pysoem is required for real EtherCAT but not installed.") from exc
         raise NotImplementedError(
             "Real EtherCAT master setup with pysoem is stubbed in this example. "
             "Call create_bus() without interface_name to use FakeEtherCATBus."
@@ -1,30 +1,90 @@
 from __future__ import annotations
 
 import threading
+import time
 from collections import deque
-from datetime import datetime
-from typing import List
+from itertools import islice
+from typing import Any, Iterable, List
+
+
+class SPSCLog:
+    """
+    Lock-free single-producer/single-consumer queue.
+    deque.append/popleft are atomic under the GIL; when full, the oldest
+    entry is dropped.
+    """
+
+    def __init__(self, cap: int) -> None:
+        self._q: deque[Any] = deque(maxlen=cap)
+
+    def push(self, item: Any) -> None:
+        self._q.append(item)
+
+    def drain(self) -> List[Any]:
+        # Only the consumer pops, so at least len(q) items are available even
+        # while the producer keeps appending.
+        q = self._q
+        return [q.popleft() for _ in range(len(q))]
 
 
 class LogBuffer:
-    """Thread-safe bounded log buffer."""
+    """
+    Thread-safe bounded log buffer.
+    Entries are stored raw as (time_ns, message); the "[HH:MM:SS]" prefix is
+    formatted on read, reusing the last formatted second.
+    Lines not yet consumed via drain_new() are also pushed to an SPSCLog so
+    a single UI reader can take them without touching the history lock.
+    """
 
     def __init__(self, max_entries: int = 300) -> None:
         self.max_entries = max_entries
-        self._items: deque[str] = deque(maxlen=max_entries)
+        self._items: deque[tuple[int, str]] = deque(maxlen=max_entries)
+        self._unread = SPSCLog(max_entries)
         self._lock = threading.Lock()
+        # (second, formatted prefix); swapped as one tuple so it needs no lock.
+        self._last_stamp: tuple[int, str] = (-1, "")
+        # Bumped on every add; as_text() reuses its last result while unchanged.
+        self._seq = 0
+        self._text_cache: tuple[int, int | None, str] | None = None
 
     def add(self, message: str) -> None:
-        ts = datetime.now().strftime("%H:%M:%S")
-        entry = f"[{ts}] {message}"
+        entry = (time.time_ns(), message)
+        self._unread.push(entry)
         with self._lock:
             self._items.append(entry)
+            self._seq += 1
 
     def get_lines(self, limit: int | None = None) -> List[str]:
         with self._lock:
-            if limit is None or limit >= len(self._items):
-                return list(self._items)
-            return list(self._items)[-limit:]
+            items = list(self._tail(limit))
+        return [self._format(ns, message) for ns, message in items]
+
+    def drain_new(self) -> List[str]:
+        """Return lines added since the previous call (single consumer only)."""
+        return [self._format(ns, message) for ns, message in self._unread.drain()]
 
     def as_text(self, limit: int | None = None) -> str:
-        return "\n".join(self.get_lines(limit=limit))
+        with self._lock:
+            cache = self._text_cache
+            if cache is not None and cache[0] == self._seq and cache[1] == limit:
+                return cache[2]
+            # Format straight off the deque: one list for join instead of a raw
+            # snapshot plus a formatted copy.
+            text = "\n".join([self._format(ns, message) for ns, message in self._tail(limit)])
+            self._text_cache = (self._seq, limit, text)
+            return text
+
+    def _tail(self, limit: int | None) -> Iterable[tuple[int, str]]:
+        # Caller holds self._lock.
+        items = self._items
+        if limit is None or limit >= len(items):
+            return items
+        return islice(items, len(items) - limit, None)
+
+    def _format(self, ns: int, message: str) -> str:
+        sec = ns // 1_000_000_000
+        stamp = self._last_stamp
+        if stamp[0] != sec:
+            stamp = (sec, time.strftime("[%H:%M:%S] ", time.localtime(sec)))
+            self._last_stamp = stamp
+        return stamp[1] + message
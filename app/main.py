@@ -1,16 +1,25 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Tuple
+from collections import deque
+from typing import Any, List, Mapping, Sequence, Tuple
 import time
 
 from .ethercat_bus import create_bus
 from .log_buffer import LogBuffer
-from .piston_client import DEFAULT_DURATIONS, PistonClient
+from .piston_client import DEFAULT_DURATIONS, PistonClient, Status, live_remaining_ms
+
+# Log panes are trimmed back to KEEP lines once they exceed MAX lines.
+LOG_VIEW_MAX_LINES = 400
+LOG_VIEW_KEEP_LINES = 300
+# Max lines inserted per event-loop pass; the rest is deferred via after_idle.
+LOG_VIEW_CHUNK_LINES = 20
 
 
 class SignalGraph:
     """Lightweight live signal monitor (step plot)."""
 
+    HISTORY_LEN = 512
+
     def __init__(
         self,
         parent: tk.Widget,
@@ -23,67 +32,97 @@ class SignalGraph:
         self.width = width
         self.height = height
         self.window_s = window_s
-        self.history: dict[str, list[tuple[float, bool]]] = {name: [] for name, _ in signals}
+        # Per signal: parallel (monotonic_ns, value) ring buffers of edge transitions.
+        self.history: dict[str, tuple[deque[int], deque[bool]]] = {
+            name: (deque(maxlen=self.HISTORY_LEN), deque(maxlen=self.HISTORY_LEN)) for name, _ in signals
+        }
         self.label_pad = 90
+        # x-scaling constants for _to_x
+        self._plot_w = width - self.label_pad
+        self._window_ns = max(1_000_000, int(window_s * 1_000_000_000))
+        # Edges closer than one pixel in time would overdraw; _draw merges them.
+        self._min_dx_ns = self._window_ns // max(1, self._plot_w)
+        self._draw_pending = False
 
         frame = ttk.LabelFrame(parent, text="Signal Monitor (last 20s)")
         frame.pack(fill="both", expand=False, padx=4, pady=8)
         self.canvas = tk.Canvas(frame, width=width, height=height, bg="#0b1021", highlightthickness=1, highlightbackground="#334155")
         self.canvas.pack(fill="both", expand=True)
 
-    def update(self, values: dict[str, bool]) -> None:
-        now = time.monotonic()
-        for name, _ in self.signals:
-            val = bool(values.get(name, False))
-            hist = self.history[name]
-            if not hist or hist[-1][1] != val:
-                hist.append((now, val))
-            self._trim_history(name, now)
-        self._draw(now)
-
-    def _trim_history(self, name: str, now: float) -> None:
-        hist = self.history[name]
-        cutoff = now - self.window_s
-        while hist and hist[0][0] < cutoff:
-            hist.pop(0)
-        if not hist:
-            hist.append((now, False))
-
-    def _draw(self, now: float) -> None:
-        self.canvas.delete("all")
-        row_h = self.height / (len(self.signals) + 1)
-
-        for idx, (name, color) in enumerate(self.signals):
+        # Canvas items are created once; _draw only moves the signal traces.
+        row_h = height / (len(signals) + 1)
+        self._levels: dict[str, tuple[float, float]] = {}
+        self._line_ids: dict[str, int] = {}
+        for idx, (name, color) in enumerate(signals):
             y_mid = (idx + 1) * row_h
+            self._levels[name] = (y_mid + row_h * 0.25, y_mid - row_h * 0.25)
             self.canvas.create_text(8, y_mid, text=name, anchor="w", fill="#cbd5e1", font=("Segoe UI", 9, "bold"))
-            hist = self.history[name]
-            if not hist:
-                continue
-            points = hist.copy()
-            last_val = points[-1][1]
-            points.append((now, last_val))
-
-            prev_t, prev_v = points[0]
-            prev_x = self._to_x(prev_t, now)
-            prev_y = y_mid - (row_h * 0.25 if prev_v else -row_h * 0.25)
-
-            for t, v in points[1:]:
-                x = self._to_x(t, now)
-                y = y_mid - (row_h * 0.25 if prev_v else -row_h * 0.25)
-                self.canvas.create_line(prev_x, y, x, y, fill=color, width=2)
-                if v != prev_v:
-                    y2 = y_mid - (row_h * 0.25 if v else -row_h * 0.25)
-                    self.canvas.create_line(x, y, x, y2, fill=color, width=2)
-                prev_x, prev_v = x, v
-
+            self._line_ids[name] = self.canvas.create_line(0, 0, 0, 0, fill=color, width=2, tags=name)
             # grid line
             self.canvas.create_line(self.label_pad, y_mid, self.width, y_mid, fill="#1e293b", dash=(2, 2))
 
-    def _to_x(self, t: float, now: float) -> float:
-        span = max(0.001, self.window_s)
+    def update(self, values: Sequence[bool]) -> None:
+        """Record one sample; values are ordered like self.signals."""
+        now = time.monotonic_ns()
+        for (name, _), val in zip(self.signals, values):
+            ts, vs = self.history[name]
+            if not vs or vs[-1] != val:
+                ts.append(now)
+                vs.append(val)
+            self._trim_history(name, now)
+        # Coalesce updates arriving within one event-loop pass into one redraw.
+        if not self._draw_pending:
+            self._draw_pending = True
+            self.canvas.after_idle(self._draw_once)
+
+    def _draw_once(self) -> None:
+        self._draw_pending = False
+        self._draw(time.monotonic_ns())
+
+    def _trim_history(self, name: str, now: int) -> None:
+        ts, vs = self.history[name]
+        cutoff = now - self._window_ns
+        while ts and ts[0] < cutoff:
+            ts.popleft()
+            vs.popleft()
+        if not ts:
+            ts.append(now)
+            vs.append(False)
+
+    def _draw(self, now: int) -> None:
+        for name, _ in self.signals:
+            ts, vs = self.history[name]
+            if not ts:
+                continue
+            levels = self._levels[name]
+            points = zip(ts, vs)
+            prev_t, prev_v = next(points)
+            y = levels[prev_v]
+            coords = [self._to_x(prev_t, now), y]
+            for t, v in points:
+                if v == prev_v:
+                    continue
+                prev_v = v
+                if t - prev_t < self._min_dx_ns:
+                    # Sub-pixel edge: keep only the latest level at the last vertex.
+                    y = coords[-1] = levels[v]
+                    continue
+                x = self._to_x(t, now)
+                coords += (x, y)
+                y = levels[v]
+                coords += (x, y)
+                prev_t = t
+            # Hold the last value up to "now" at the right edge.
+            coords += (self.width, y)
+            self.canvas.coords(self._line_ids[name], coords)
+
+    def _to_x(self, t: int, now: int) -> int:
         delta = now - t
-        frac = max(0.0, min(1.0, delta / span))
-        return self.width - frac * (self.width - self.label_pad)
+        if delta <= 0:
+            return self.width
+        if delta >= self._window_ns:
+            return self.label_pad
+        return self.width - delta * self._plot_w // self._window_ns
 
 
 class HMIServer:
@@ -102,14 +141,16 @@ class HMIServer:
 
         self.pistons: List[dict] = []
         self.last_status = None
-        self.last_timestamp = 0.0
+        self._applied_version = 0
+        self._live_state: Mapping[str, Any] = {}
+        self._signal_inputs: tuple[int | None, bool, Status | None] = (None, False, None)
+        self._log_backlog: dict[tk.Text, List[str]] = {}
         self._pulse_flags = {"start_cmd": False, "stop_cmd": False}
-        self._server_log_cursor = 0
-        self._client_log_cursor = 0
 
         self._build_ui()
         self._reset_states()
         self._poll_bus()
+        self._redraw()
 
     def _build_ui(self) -> None:
         root = self.root
@@ -191,6 +232,10 @@ class HMIServer:
                     "timer_var": timer_var,
                     "timer_label": timer_label,
                     "name": f"Piston {idx + 1}",
+                    # Last values pushed to Tk; unchanged values are not re-sent.
+                    "_last_state": None,
+                    "_last_bg": None,
+                    "_last_timer": None,
                 }
             )
 
@@ -282,7 +327,6 @@ class HMIServer:
 
     def _log(self, message: str) -> None:
         self.server_log.add(message)
-        self._refresh_logs()
 
     def _reset_times(self) -> None:
         for idx, piston in enumerate(self.pistons):
@@ -293,9 +337,19 @@ class HMIServer:
 
     def _reset_states(self) -> None:
         for piston in self.pistons:
-            piston["state_var"].set("Idle")
-            piston["state_label"].configure(bg="#d9d9d9")
-            piston["timer_var"].set("-")
+            self._set_piston_view(piston, "Idle", "#d9d9d9", "-")
+
+    @staticmethod
+    def _set_piston_view(piston: dict, state_text: str, bg: str, timer_text: str) -> None:
+        if piston["_last_state"] != state_text:
+            piston["state_var"].set(state_text)
+            piston["_last_state"] = state_text
+        if piston["_last_bg"] != bg:
+            piston["state_label"].configure(bg=bg)
+            piston["_last_bg"] = bg
+        if piston["_last_timer"] != timer_text:
+            piston["timer_var"].set(timer_text)
+            piston["_last_timer"] = timer_text
 
     def _set_latch_indicator(self, latched: bool) -> None:
         if latched:
@@ -330,16 +384,13 @@ class HMIServer:
         self._set_latch_indicator(False)
         self._pulse_flags["start_cmd"] = True
 
-    def _apply_state_to_ui(self, state: dict) -> None:
+    def _apply_state_to_ui(self, state: Mapping[str, Any]) -> None:
         latch = bool(state.get("latching"))
         self._set_latch_indicator(latch)
 
         active = state.get("active_piston")
-        direction = state.get("direction")
         status = state.get("status")
         message = state.get("message")
-        timestamp = state.get("timestamp", 0)
-        remaining_ms = state.get("remaining_ms", None)
 
         if status != self.last_status or message:
             self.status_var.set(message or f"Status: {status}")
@@ -348,62 +399,96 @@ class HMIServer:
             if message:
                 self._log(message)
             self.last_status = status
-            self.last_timestamp = timestamp
 
+        self._live_state = state
+        self._refresh_pistons()
+        self._signal_inputs = (active, latch, status)
+
+    def _refresh_pistons(self) -> None:
+        state = self._live_state
+        active = state.get("active_piston")
+        direction = state.get("direction")
         if active is not None and direction:
+            remaining_ms = live_remaining_ms(state)
             for idx, piston in enumerate(self.pistons):
                 if idx == active:
-                    color = "#4caf50" if direction == "extend" else "#ff9800"
-                    piston["state_var"].set("Extend" if direction == "extend" else "Retract")
-                    piston["state_label"].configure(bg=color)
-                    piston["timer_var"].set(self._format_remaining(remaining_ms))
+                    extending = direction == "extend"
+                    self._set_piston_view(
+                        piston,
+                        "Extend" if extending else "Retract",
+                        "#4caf50" if extending else "#ff9800",
+                        self._format_remaining(remaining_ms),
+                    )
                 else:
-                    piston["state_var"].set("Idle")
-                    piston["state_label"].configure(bg="#d9d9d9")
-                    piston["timer_var"].set("-")
+                    self._set_piston_view(piston, "Idle", "#d9d9d9", "-")
         else:
             self._reset_states()
 
-        self._update_signal_graph(active, latch, status)
-
     def _poll_bus(self) -> None:
-        state = self.bus.read_slave_state(self.slave_id)
-        if state and state.get("timestamp", 0) >= self.last_timestamp:
-            self._apply_state_to_ui(state)
+        # Fast, cheap tick: only touch the UI when the client published a new state.
+        version = self.bus.state_version(self.slave_id)
+        if version != self._applied_version:
+            state = self.bus.read_slave_state(self.slave_id)
+            self._applied_version = version
+            if state:
+                self._apply_state_to_ui(state)
+        self.root.after(50, self._poll_bus)
+
+    def _redraw(self) -> None:
+        # Slower 5 Hz tick for the countdowns, scrolling signal graph and log panes.
+        self._refresh_pistons()
+        self._update_signal_graph(*self._signal_inputs)
         self._refresh_logs()
-        self.root.after(100, self._poll_bus)
-
-    def _update_signal_graph(self, active: int | None, latch: bool, status: str | None) -> None:
-        running = status == "running"
-        signals = {
-            "start_cmd": self._pulse_flags["start_cmd"],
-            "stop_cmd": self._pulse_flags["stop_cmd"],
-            "latch": latch,
-            "running": running,
-            "p1_active": active == 0 and running,
-            "p2_active": active == 1 and running,
-            "p3_active": active == 2 and running,
-        }
-        self.signal_graph.update(signals)
+        self.root.after(200, self._redraw)
+
+    def _update_signal_graph(self, active: int | None, latch: bool, status: Status | None) -> None:
+        running = status is Status.RUNNING
+        # Same order as the signals passed to SignalGraph in _build_ui.
+        self.signal_graph.update(
+            (
+                self._pulse_flags["start_cmd"],
+                self._pulse_flags["stop_cmd"],
+                latch,
+                running,
+                active == 0 and running,
+                active == 1 and running,
+                active == 2 and running,
+            )
+        )
         # Pulse cleanup
         self._pulse_flags["start_cmd"] = False
         self._pulse_flags["stop_cmd"] = False
 
     def _refresh_logs(self) -> None:
-        self._append_buffer(self.server_log_box, self.server_log, "_server_log_cursor")
-        self._append_buffer(self.client_log_box, self.client_log, "_client_log_cursor")
+        self._append_buffer(self.server_log_box, self.server_log)
+        self._append_buffer(self.client_log_box, self.client_log)
 
-    def _append_buffer(self, widget: tk.Text, buffer: LogBuffer, cursor_attr: str) -> None:
-        lines = buffer.get_lines()
-        cursor = getattr(self, cursor_attr)
-        if cursor >= len(lines):
+    def _append_buffer(self, widget: tk.Text, buffer: LogBuffer) -> None:
+        new_lines = buffer.drain_new()
+        if not new_lines:
+            return
+        backlog = self._log_backlog.get(widget)
+        if backlog is not None:
+            # A deferred chunk is still pending; queue behind it to keep order.
+            backlog.extend(new_lines)
             return
-        new_lines = lines[cursor:]
+        self._append_buffer_continuation(widget, new_lines)
+
+    def _append_buffer_continuation(self, widget: tk.Text, lines: List[str]) -> None:
+        chunk = lines[:LOG_VIEW_CHUNK_LINES]
+        remaining = lines[LOG_VIEW_CHUNK_LINES:]
+        if remaining:
+            self._log_backlog[widget] = remaining
+            self.root.after_idle(self._append_buffer_continuation, widget, remaining)
+        else:
+            self._log_backlog.pop(widget, None)
         widget.configure(state="normal")
-        widget.insert("end", "\n".join(new_lines) + "\n")
+        widget.insert("end", "\n".join(chunk) + "\n")
+        line_count = int(widget.index("end-1c").split(".")[0])
+        if line_count > LOG_VIEW_MAX_LINES:
+            widget.delete("1.0", f"{line_count - LOG_VIEW_KEEP_LINES}.0")
         widget.see("end")
         widget.configure(state="disabled")
-        setattr(self, cursor_attr, len(lines))
 
     @staticmethod
     def _format_remaining(remaining_ms: int | None) -> str:
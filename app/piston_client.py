@@ -1,7 +1,9 @@
 import threading
 import time
+from array import array
 from dataclasses import dataclass
-from typing import List, Tuple
+from enum import Enum
+from typing import Any, Callable, ClassVar, Dict, List, Mapping, Tuple
 
 import sys
 from pathlib import Path
@@ -19,6 +21,17 @@ except ImportError:
     from log_buffer import LogBuffer
 
 
+class Status(str, Enum):
+    """Client status; str-valued so payloads stay JSON-compatible, compare with `is`."""
+
+    RUNNING = "running"
+    COMPLETE = "complete"
+    STOPPED = "stopped"
+
+    def __str__(self) -> str:
+        return self.value
+
+
 @dataclass
 class Stage:
     piston_index: int
@@ -26,7 +39,18 @@ class Stage:
     duration_ms: int
 
 
-DEFAULT_DURATIONS: List[Tuple[float, float]] = [(1.5, 1.0), (2.0, 1.0), (2.5, 1.0)]
+DEFAULT_DURATIONS: Tuple[Tuple[float, float], ...] = ((1.5, 1.0), (2.0, 1.0), (2.5, 1.0))
+
+
+def live_remaining_ms(state: Mapping[str, Any]) -> int | None:
+    """
+    Countdown of the active stage, computed from its published deadline_ns
+    (time.monotonic_ns() of the client's process; the fake bus is in-process).
+    """
+    deadline_ns = state.get("deadline_ns")
+    if deadline_ns is None:
+        return state.get("remaining_ms")
+    return max(0, (deadline_ns - time.monotonic_ns()) // 1_000_000)
 
 
 class PistonClient:
@@ -45,82 +69,138 @@ class PistonClient:
         self.logger = logger
         self.latched = False
         self.running = False
-        self.durations = DEFAULT_DURATIONS.copy()
+        # Flat (e0, r0, e1, r1, e2, r2) in seconds and ms, and the reusable stages built from them.
+        self._durations = array("d", [value for pair in DEFAULT_DURATIONS for value in pair])
+        self._durations_ms: Tuple[int, ...] = self._to_ms(self._durations)
+        self._stage_pool: List[Stage] = [
+            Stage(i // 2, "extend" if i % 2 == 0 else "retract", 0) for i in range(len(self._durations))
+        ]
         self.sequence: List[Stage] = []
         self.stage_index = 0
-        self.stage_started_at = 0.0
+        # Integer time.monotonic_ns() deadlines.
+        self._current_deadline_ns = 0
         self.cycle_count = 0
-        self._next_cycle_at: float | None = None
+        self._next_cycle_at_ns: int | None = None
+        self._published_key: tuple | None = None
+        self._wake = threading.Event()
+        self._wake.set()  # check the mailbox once on startup
+        self.bus.register_wake_event(self.slave_id, self._wake)
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
 
     def _loop(self) -> None:
+        # Sleep until the next stage edge / latch restart, or until the bus
+        # signals a new command; block indefinitely when idle.
         while True:
-            self._handle_commands()
+            # The wake flag doubles as the "command pending" marker: deadline
+            # wakeups skip the mailbox. Clear before popping so a command
+            # written meanwhile re-sets the flag instead of being missed.
+            if self._wake.is_set():
+                self._wake.clear()
+                self._handle_commands()
             self._process_cycle()
-            time.sleep(0.01)
+            deadline_ns = self._next_deadline_ns()
+            timeout = None if deadline_ns is None else max(0, deadline_ns - time.monotonic_ns()) / 1e9
+            self._wake.wait(timeout)
+
+    def _next_deadline_ns(self) -> int | None:
+        if self.running:
+            if self.stage_index >= len(self.sequence):
+                return time.monotonic_ns()
+            return self._current_deadline_ns
+        if self.latched and self._next_cycle_at_ns:
+            return self._next_cycle_at_ns
+        return None
 
     def _handle_commands(self) -> None:
         cmd = self.bus.pop_slave_command(self.slave_id)
         if not cmd:
             return
-        ctype = cmd.get("type")
-        if ctype == "start":
-            durations = cmd.get("durations") or self.durations
-            self._apply_durations(durations)
-            self.latched = bool(cmd.get("latched", True))
-            self._start_cycle()
-            self._log(f"Start command received (latched={'on' if self.latched else 'off'}).")
-        elif ctype == "single":
-            durations = cmd.get("durations") or self.durations
-            self._apply_durations(durations)
-            self.latched = False
-            self._start_cycle()
-            self._log("Single-cycle command received.")
-        elif ctype == "stop":
-            self.latched = False
-            self.running = False
-            self._next_cycle_at = None
-            self.stage_index = 0
-            self.stage_started_at = 0.0
-            self._publish_state(
-                status="stopped",
-                direction=None,
-                active_piston=None,
-                remaining_ms=0,
-                message="Stop command received.",
-            )
-            self._log("Stop command received; sequence halted.")
-
-    def _apply_durations(self, durations: List[Tuple[float, float]]) -> None:
-        clean = []
-        for pair in durations:
-            try:
-                extend, retract = float(pair[0]), float(pair[1])
-            except Exception:
-                extend, retract = 1.0, 1.0
-            clean.append((max(0.05, extend), max(0.05, retract)))
-        while len(clean) < 3:
-            clean.append(DEFAULT_DURATIONS[len(clean)])
-        self.durations = clean[:3]
+        handler = self._HANDLERS.get(cmd.get("type"))
+        if handler:
+            handler(self, cmd)
+
+    def _on_start(self, cmd: Mapping[str, Any]) -> None:
+        self._apply_durations(cmd.get("durations"))
+        self.latched = bool(cmd.get("latched", True))
+        self._start_cycle()
+        self._log(f"Start command received (latched={'on' if self.latched else 'off'}).")
+
+    def _on_single(self, cmd: Mapping[str, Any]) -> None:
+        self._apply_durations(cmd.get("durations"))
+        self.latched = False
+        self._start_cycle()
+        self._log("Single-cycle command received.")
+
+    def _on_stop(self, cmd: Mapping[str, Any]) -> None:
+        self.latched = False
+        self.running = False
+        self._next_cycle_at_ns = None
+        self.stage_index = 0
+        self._publish_state(
+            status=Status.STOPPED,
+            direction=None,
+            active_piston=None,
+            remaining_ms=0,
+            message="Stop command received.",
+        )
+        self._log("Stop command received; sequence halted.")
+
+    # Command "type" -> handler (plain functions, called as handler(self, cmd)).
+    _HANDLERS: ClassVar[Dict[str, Callable[["PistonClient", Mapping[str, Any]], None]]] = {
+        "start": _on_start,
+        "single": _on_single,
+        "stop": _on_stop,
+    }
+
+    @property
+    def durations(self) -> List[Tuple[float, float]]:
+        flat = self._durations
+        return [(flat[i], flat[i + 1]) for i in range(0, len(flat), 2)]
+
+    def _apply_durations(self, durations: List[Tuple[float, float]] | None) -> None:
+        if not durations:
+            return
+        clean = array("d", self._durations)
+        for idx, default in enumerate(DEFAULT_DURATIONS):
+            if idx < len(durations):
+                pair = durations[idx]
+                try:
+                    extend, retract = float(pair[0]), float(pair[1])
+                except Exception:
+                    extend, retract = 1.0, 1.0
+                extend, retract = max(0.05, extend), max(0.05, retract)
+            else:
+                extend, retract = default
+            clean[2 * idx] = extend
+            clean[2 * idx + 1] = retract
+        if clean == self._durations:
+            return
+        self._durations = clean
+        self._durations_ms = self._to_ms(clean)
+
+    @staticmethod
+    def _to_ms(durations: array) -> Tuple[int, ...]:
+        # Clamped to the 50 ms stage minimum here, once per durations change.
+        return tuple(max(50, int(value * 1000)) for value in durations)
 
     def _start_cycle(self) -> None:
         self.sequence = self._build_sequence()
         self.stage_index = 0
-        self.stage_started_at = time.monotonic()
         self.running = True
         if not self.sequence:
             self.running = False
             self._publish_state(
-                status="stopped",
+                status=Status.STOPPED,
                 direction=None,
                 active_piston=None,
                 remaining_ms=0,
                 message="Sequence empty.",
             )
             return
+        self._enter_stage(self.sequence[0], time.monotonic_ns())
         self._publish_state(
-            status="running",
+            status=Status.RUNNING,
             direction=self.sequence[0].action,
             active_piston=self.sequence[0].piston_index,
             remaining_ms=self.sequence[0].duration_ms,
@@ -129,20 +209,20 @@ class PistonClient:
         self._log("Sequence started.")
 
     def _build_sequence(self) -> List[Stage]:
-        result: List[Stage] = []
-        for idx, pair in enumerate(self.durations):
-            extend_ms = int(pair[0] * 1000)
-            retract_ms = int(pair[1] * 1000)
-            result.append(Stage(idx, "extend", extend_ms))
-            result.append(Stage(idx, "retract", retract_ms))
-        return result
+        # Reuse the pooled stages; only their durations change between cycles.
+        for stage, duration_ms in zip(self._stage_pool, self._durations_ms):
+            stage.duration_ms = duration_ms
+        return self._stage_pool
+
+    def _enter_stage(self, stage: Stage, now_ns: int) -> None:
+        self._current_deadline_ns = now_ns + stage.duration_ms * 1_000_000
 
     def _process_cycle(self) -> None:
-        now = time.monotonic()
+        now = time.monotonic_ns()
 
-        if not self.running and self.latched and self._next_cycle_at and now >= self._next_cycle_at:
+        if not self.running and self.latched and self._next_cycle_at_ns and now >= self._next_cycle_at_ns:
             self._start_cycle()
-            self._next_cycle_at = None
+            self._next_cycle_at_ns = None
             return
 
         if not self.running:
@@ -152,38 +232,36 @@ class PistonClient:
             self.running = False
             self.cycle_count += 1
             self._publish_state(
-                status="complete",
+                status=Status.COMPLETE,
                 direction=None,
                 active_piston=None,
                 remaining_ms=0,
                 message="Cycle complete.",
             )
             if self.latched:
-                self._next_cycle_at = now + 0.5
+                self._next_cycle_at_ns = now + 500_000_000
             return
 
-        stage = self.sequence[self.stage_index]
-        elapsed_ms = (now - self.stage_started_at) * 1000
-        if elapsed_ms >= max(stage.duration_ms, 50):
+        if now >= self._current_deadline_ns:
             self.stage_index += 1
             if self.stage_index >= len(self.sequence):
                 self.running = False
                 self.cycle_count += 1
                 self._publish_state(
-                    status="complete",
+                    status=Status.COMPLETE,
                     direction=None,
                     active_piston=None,
                     remaining_ms=0,
                     message="Cycle complete.",
                 )
                 if self.latched:
-                    self._next_cycle_at = now + 0.5
+                    self._next_cycle_at_ns = now + 500_000_000
                 return
 
-            self.stage_started_at = now
             next_stage = self.sequence[self.stage_index]
+            self._enter_stage(next_stage, now)
             self._publish_state(
-                status="running",
+                status=Status.RUNNING,
                 direction=next_stage.action,
                 active_piston=next_stage.piston_index,
                 remaining_ms=next_stage.duration_ms,
@@ -195,12 +273,19 @@ class PistonClient:
 
     def _publish_state(
         self,
-        status: str,
+        status: Status,
         direction: str | None,
         active_piston: int | None,
         remaining_ms: int | None = None,
         message: str | None = None,
     ) -> None:
+        deadline_ns = self._current_deadline_ns if status is Status.RUNNING else None
+        # Readers derive the countdown from deadline_ns, so a publish that
+        # changes nothing else carries no information.
+        key = (status, active_piston, direction, self.stage_index, self.latched, self.cycle_count, deadline_ns, message)
+        if key == self._published_key:
+            return
+        self._published_key = key
         state = {
             "status": status,
             "active_piston": active_piston,
@@ -208,6 +293,7 @@ class PistonClient:
             "stage_index": self.stage_index,
             "latching": self.latched,
             "cycle_count": self.cycle_count,
+            "deadline_ns": deadline_ns,
             "timestamp": time.time(),
         }
         if remaining_ms is None:
@@ -222,9 +308,7 @@ class PistonClient:
     def _calculate_remaining_ms(self) -> int:
         if not self.running or self.stage_index >= len(self.sequence):
             return 0
-        stage = self.sequence[self.stage_index]
-        elapsed_ms = (time.monotonic() - self.stage_started_at) * 1000
-        return max(0, int(stage.duration_ms - elapsed_ms))
+        return max(0, (self._current_deadline_ns - time.monotonic_ns()) // 1_000_000)
 
     def _log(self, message: str) -> None:
         if self.logger:
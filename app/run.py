@@ -94,11 +94,13 @@ def run_client_only() -> None:
     bus = create_bus()
     PistonClient(bus)
     print("Client running on shared FakeEtherCATBus. Press Ctrl+C to exit.")
+    stop_event = threading.Event()
+    # Block until Ctrl+C instead of waking every second. Windows cannot
+    # interrupt an untimed wait, so wake there occasionally to deliver it.
+    timeout = 1.0 if os.name == "nt" else None
     try:
-        while True:
-            # lightweight wait to keep thread alive
-            import time
-            time.sleep(1)
+        while not stop_event.wait(timeout):
+            pass
     except KeyboardInterrupt:
         return
 
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import time
-from typing import List, Tuple
+import html
+from typing import Any, List, Mapping, Tuple
 
 import sys
 from pathlib import Path
 
+import pandas as pd
 import streamlit as st
 
 APP_ROOT = Path(__file__).resolve().parent
@@ -15,7 +16,7 @@ if str(APP_ROOT) not in sys.path:
 
 from ethercat_bus import create_bus
 from log_buffer import LogBuffer
-from piston_client import DEFAULT_DURATIONS, PistonClient
+from piston_client import DEFAULT_DURATIONS, PistonClient, Status, live_remaining_ms
 
 SLAVE_ID = "piston-client"
 REFRESH_SECONDS = 0.5
@@ -34,24 +35,46 @@ def init_app_state() -> None:
             slave_id=SLAVE_ID,
             logger=st.session_state.client_log,
         )
-    for idx, (ext, ret) in enumerate(DEFAULT_DURATIONS):
-        st.session_state.setdefault(f"extend_{idx}", ext)
-        st.session_state.setdefault(f"retract_{idx}", ret)
+    if "extend_0" not in st.session_state:
+        for idx, (ext, ret) in enumerate(DEFAULT_DURATIONS):
+            st.session_state[f"extend_{idx}"] = ext
+            st.session_state[f"retract_{idx}"] = ret
     st.session_state.setdefault("auto_refresh", True)
+    if "state_df" not in st.session_state:
+        # Fixed 3-row table; render_state_panel updates its cells in place.
+        st.session_state.state_df = pd.DataFrame(
+            {
+                "Piston": [f"Piston {idx + 1}" for idx in range(3)],
+                "Direction": ["-"] * 3,
+                "Countdown": ["-"] * 3,
+                "Duration (extend/retract)": ["-"] * 3,
+            }
+        )
+        st.session_state.state_df_durations = None
+    if "live_state" not in st.session_state:
+        st.session_state.live_state = {}
+        st.session_state.live_state_version = 0
 
 
 def get_current_durations() -> List[Tuple[float, float]]:
-    durations: List[Tuple[float, float]] = []
-    for idx in range(3):
-        durations.append(
+    # Cached until invalidate_durations(); callers must not mutate the list.
+    durations = st.session_state.get("_durations_cached")
+    if durations is None:
+        durations = [
             (
                 float(st.session_state.get(f"extend_{idx}", DEFAULT_DURATIONS[idx][0])),
                 float(st.session_state.get(f"retract_{idx}", DEFAULT_DURATIONS[idx][1])),
             )
-        )
+            for idx in range(3)
+        ]
+        st.session_state["_durations_cached"] = durations
     return durations
 
 
+def invalidate_durations() -> None:
+    st.session_state.pop("_durations_cached", None)
+
+
 def send_master_command(cmd: str) -> None:
     bus = st.session_state.bus
     durations = get_current_durations()
@@ -99,7 +122,9 @@ def render_controls() -> None:
                 key=f"retract_{idx}",
                 value=st.session_state[f"retract_{idx}"],
             )
-        submitted = st.form_submit_button("Save Durations")
+        # Inputs inside a form only change on submit, so invalidate there
+        # (forms do not allow on_change callbacks on the inputs themselves).
+        submitted = st.form_submit_button("Save Durations", on_click=invalidate_durations)
         if submitted:
             st.session_state.server_log.add("Durations updated.")
 
@@ -117,42 +142,62 @@ def render_controls() -> None:
         for idx, (ext, ret) in enumerate(DEFAULT_DURATIONS):
             st.session_state[f"extend_{idx}"] = ext
             st.session_state[f"retract_{idx}"] = ret
+        invalidate_durations()
         st.session_state.server_log.add("Durations reset to defaults.")
         st.rerun()
 
 
-def render_state_panel(state: dict) -> None:
-    st.subheader("Live State")
+def render_state_panel(state: Mapping[str, Any]) -> None:
     status = state.get("status") or "ready"
     message = state.get("message")
     latch = bool(state.get("latching"))
     active = state.get("active_piston")
     direction = state.get("direction")
-    remaining_ms = state.get("remaining_ms")
+    remaining_ms = live_remaining_ms(state)
     cycle_count = state.get("cycle_count", 0)
-    running = status == "running"
-
-    col_a, col_b, col_c = st.columns(3)
-    col_a.metric("Status", status)
-    col_b.metric("Latch", "On" if latch else "Off")
-    col_c.metric("Cycle Count", str(cycle_count))
+    running = status is Status.RUNNING
+
+    # One markdown element instead of subheader + columns + 3 metrics: a
+    # single small delta per refresh.
+    metrics = "".join(
+        f'<div style="flex:1"><small>{label}</small>'
+        f'<div style="font-size:1.75rem">{html.escape(value)}</div></div>'
+        for label, value in (
+            ("Status", str(status)),
+            ("Latch", "On" if latch else "Off"),
+            ("Cycle Count", str(cycle_count)),
+        )
+    )
+    st.markdown(
+        f'<h3>Live State</h3><div style="display:flex;gap:1rem">{metrics}</div>',
+        unsafe_allow_html=True,
+    )
 
     if message:
         st.info(message)
 
-    rows = []
-    durations = get_current_durations()
+    df = st.session_state.state_df
+    durations = tuple(get_current_durations())
+    if durations != st.session_state.state_df_durations:
+        for idx, (ext, ret) in enumerate(durations):
+            df.iat[idx, 3] = f"{ext} s / {ret} s"
+        st.session_state.state_df_durations = durations
     for idx in range(3):
         is_active = running and active == idx
-        rows.append(
-            {
-                "Piston": f"Piston {idx + 1}",
-                "Direction": "Extend" if (is_active and direction == "extend") else ("Retract" if is_active else "-"),
-                "Countdown": format_remaining(remaining_ms if is_active else None),
-                "Duration (extend/retract)": f"{durations[idx][0]} s / {durations[idx][1]} s",
-            }
-        )
-    st.dataframe(rows, use_container_width=True)
+        df.iat[idx, 1] = "Extend" if (is_active and direction == "extend") else ("Retract" if is_active else "-")
+        df.iat[idx, 2] = format_remaining(remaining_ms if is_active else None)
+    st.dataframe(df, use_container_width=True)
+
+
+def live_state_panel() -> None:
+    # Reuse the last snapshot while the client has not published a new one;
+    # the countdown itself is derived from its deadline on every render.
+    bus = st.session_state.bus
+    version = bus.state_version(SLAVE_ID)
+    if version != st.session_state.live_state_version:
+        st.session_state.live_state = bus.read_slave_state(SLAVE_ID) or {}
+        st.session_state.live_state_version = version
+    render_state_panel(st.session_state.live_state)
 
 
 def render_logs() -> None:
@@ -191,20 +236,19 @@ def main() -> None:
     st.session_state.auto_refresh = st.sidebar.checkbox(
         "Auto-refresh (0.5s)", value=st.session_state.auto_refresh
     )
-    st.sidebar.write("Commands poll bus state on each refresh.")
+    st.sidebar.write("Live state and logs poll the bus on each refresh.")
+
+    # Only the live panels rerun on the timer; the controls form re-renders
+    # on user interaction alone.
+    run_every = REFRESH_SECONDS if st.session_state.auto_refresh else None
 
     cols = st.columns([1.2, 1])
     with cols[0]:
         render_controls()
     with cols[1]:
-        state = st.session_state.bus.read_slave_state(SLAVE_ID) or {}
-        render_state_panel(state)
-
-    render_logs()
+        st.fragment(live_state_panel, run_every=run_every)()
 
-    if st.session_state.auto_refresh:
-        time.sleep(REFRESH_SECONDS)
-        st.rerun()
+    st.fragment(render_logs, run_every=run_every)()
 
 
 if __name__ == "__main__":